@@ -1,10 +1,22 @@
 POLL_INTERVAL_SEC = 3
+# idle backoff ceiling; kept low so a first donation after a quiet spell isn't late
+POLL_MAX_INTERVAL_SEC = 15
 
 DA_MEDIA_URL = "https://www.donationalerts.com/api/getmediadata"
 DX_API_URL = "https://donatex.gg/api/donations/get-donations"
 YT_DL_API = "https://yt.butterflynet.work/download/mp3"
 
+# send If-None-Match / If-Modified-Since on DonateX polls (304 = nothing new)
+DX_CONDITIONAL_POLL = True
+
 QUEUE_LIMIT = 50
+# tracks after the current one that are downloaded ahead of time (and kept in temp)
+DOWNLOAD_LOOKAHEAD = 2
+# concurrent oEmbed title lookups for a batch of new DonateX donations
+OEMBED_WORKERS = 6
 
 APP_TITLE = "Donation Media Hub"
 USER_AGENT = "DonationMediaHub/1.0"
+# TCP connect timeout for every request (read timeouts are set per call): a dead
+# host fails in ~3s instead of holding a poll/download for the full read timeout
+HTTP_CONNECT_TIMEOUT = 3.05
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Callable, Optional
 
-import requests
-
-from donation_media_hub.config import USER_AGENT, YT_DL_API
+from donation_media_hub.config import HTTP_CONNECT_TIMEOUT, YT_DL_API
+from donation_media_hub.http import SESSION
 from donation_media_hub.models import Track
 from donation_media_hub.services.youtube import is_youtube_url, sanitize_filename
 
+CHUNK_SIZE = 64 * 1024
+
 
 class Downloader:
     """
@@ -19,36 +23,100 @@ class Downloader:
     def __init__(self, temp_dir: Path) -> None:
         self.temp_dir = temp_dir
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self._session = SESSION
+        # output paths claimed by in-flight downloads (they may run concurrently)
+        self._claim_lock = threading.Lock()
+        self._claimed: set[Path] = set()
 
     def download_mp3(self, track: Track, timeout: int = 40) -> Path:
         if not is_youtube_url(track.url):
             raise ValueError("Not a YouTube URL")
 
         self.temp_dir.mkdir(parents=True, exist_ok=True)
-        safe = sanitize_filename(track.title)
-        out = self.temp_dir / f"{safe}.mp3"
-        if out.exists():
-            out = self.temp_dir / f"{safe}__{int(track.created_ts)}.mp3"
-
-        r = requests.get(
-            YT_DL_API,
-            params={"url": track.url},
-            timeout=timeout,
-            headers={"user-agent": USER_AGENT},
-        )
-        r.raise_for_status()
-
-        out.write_bytes(r.content)
+        out, cached = self._claim_path(track)
+        if cached:
+            return out
+        # written under a non-.mp3 name and swapped in when complete, so an
+        # existing <name>.mp3 is always a whole file that can be reused as is
+        part = out.with_name(out.name + ".part")
+        try:
+            with self._session.get(
+                YT_DL_API,
+                params={"url": track.url},
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout),
+                stream=True,
+            ) as r:
+                r.raise_for_status()
+                try:
+                    with part.open("wb") as f:
+                        for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                            f.write(chunk)
+                    os.replace(part, out)
+                except Exception:
+                    part.unlink(missing_ok=True)
+                    raise
+        finally:
+            with self._claim_lock:
+                self._claimed.discard(out)
         return out
 
+    def _claim_path(self, track: Track) -> tuple[Path, bool]:
+        """
+        Output path named after the title plus a hash of the URL, so the same
+        link requested again maps to the same file. Returns (path, cached):
+        cached means a complete file is already there and nothing is claimed.
+        """
+        safe = sanitize_filename(track.title)
+        key = hashlib.blake2b(track.url.encode("utf-8"), digest_size=6).hexdigest()
+        with self._claim_lock:
+            out = self.temp_dir / f"{safe}__{key}.mp3"
+            if out not in self._claimed:
+                try:
+                    if out.stat().st_size > 0:
+                        return out, True
+                except OSError:
+                    pass
+            else:
+                # same link already downloading for another track
+                tid = sanitize_filename(track.track_id)
+                out = self.temp_dir / f"{safe}__{tid}.mp3"
+            self._claimed.add(out)
+        return out, False
+
     @staticmethod
-    def cleanup_keep(temp_dir: Path, keep_paths: set[str]) -> None:
-        if not temp_dir.exists():
-            return
-        for p in temp_dir.glob("*.mp3"):
-            rp = str(p.resolve())
-            if rp not in keep_paths:
+    def cleanup_keep(temp_dir: Path, keep_paths: set[str]) -> set[str]:
+        """
+        Delete every mp3 in temp_dir except keep_paths (resolved path strings).
+        Returns the resolved paths that were actually removed.
+        """
+        removed: set[str] = set()
+        # resolve the directory once; entries under it are then already canonical
+        try:
+            root = str(temp_dir.resolve())
+            it = os.scandir(root)
+        except OSError:
+            return removed
+        with it:
+            for entry in it:
+                if not entry.name.endswith(".mp3") or entry.path in keep_paths:
+                    continue
                 try:
-                    p.unlink(missing_ok=True)
+                    os.unlink(entry.path)
+                    removed.add(entry.path)
                 except Exception:
                     pass
+        return removed
+
+    @staticmethod
+    def remove_files(paths: set[str]) -> set[str]:
+        """
+        Delete the given files. Returns the paths that were actually removed.
+        """
+        removed: set[str] = set()
+        for p in paths:
+            try:
+                os.unlink(p)
+                removed.add(p)
+            except Exception:
+                pass
+        return removed
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import atexit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from donation_media_hub.config import USER_AGENT
+
+
+def make_session() -> requests.Session:
+    """
+    Pooled keep-alive session: one TCP+TLS handshake per host, not per request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"user-agent": USER_AGENT, "accept": "*/*"})
+    return session
+
+
+# Process-wide session shared by DA, DX, oEmbed and the downloader.
+SESSION = make_session()
+atexit.register(SESSION.close)
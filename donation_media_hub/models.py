@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass(slots=True)
@@ -16,3 +16,32 @@ class Track:
     )
     local_path: Optional[str] = None
     error: Optional[str] = None
+
+
+# -------------------- UI events (worker threads -> controller) --------------------
+
+
+@dataclass(slots=True)
+class LogEvent:
+    msg: str
+
+
+@dataclass(slots=True)
+class NewTracksEvent:
+    tracks: List[Track]  # one poll's batch; the consumer takes ownership
+
+
+@dataclass(slots=True)
+class TrackStatusEvent:
+    track_id: str
+    status: str
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class DownloadDoneEvent:
+    track_id: str
+    path: str  # canonical (realpath'd) str
+
+
+UIEvent = LogEvent | NewTracksEvent | TrackStatusEvent | DownloadDoneEvent
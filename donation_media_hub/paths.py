@@ -23,5 +23,6 @@ CONFIG_FILE = APP_DIR / "config.json"
 STATE_DA_FILE = APP_DIR / "state_donationalerts.json"
 STATE_DX_FILE = APP_DIR / "state_donatex.json"
 QUEUE_FILE = APP_DIR / "queue.json"
+TITLE_CACHE_FILE = APP_DIR / "title_cache.json"
 
 TEMP_DIR = Path(tempfile.gettempdir()) / "donation_media_hub_tracks"
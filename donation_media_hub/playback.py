@@ -17,17 +17,22 @@ class PlaybackState:
 
 
 class AudioPlayer:
-    def __init__(self, volume: float = 0.7) -> None:
+    def __init__(self, volume: float = 0.7, buffer: int = 4096) -> None:
         self._ready = False
         self._paused = False
-        self._init(volume)
+        # something was started since the last stop(); while False, is_playing()
+        # answers without calling into SDL
+        self._loaded = False
+        self._init(volume, buffer)
 
-    def _init(self, volume: float) -> None:
+    def _init(self, volume: float, buffer: int) -> None:
         if pygame is None:
             self._ready = False
             return
         try:
-            pygame.mixer.init()
+            # 4096 frames @ 44.1kHz ≈ 90ms latency: fine for donation playback,
+            # and far fewer mixer callbacks than SDL's default 512.
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=buffer)
             pygame.mixer.music.set_volume(float(volume))
             self._ready = True
         except Exception:
@@ -40,7 +45,7 @@ class AudioPlayer:
         return bool(self._paused)
 
     def is_playing(self) -> bool:
-        if not self._ready:
+        if not self._ready or not self._loaded:
             return False
         try:
             return bool(pygame.mixer.music.get_busy())
@@ -62,6 +67,7 @@ class AudioPlayer:
         pygame.mixer.music.load(path)
         pygame.mixer.music.set_volume(float(volume))
         pygame.mixer.music.play()
+        self._loaded = True
         self._paused = False
 
     def pause(self) -> None:
@@ -90,6 +96,7 @@ class AudioPlayer:
         except Exception:
             pass
         self._paused = False
+        self._loaded = False
 
     def shutdown(self) -> None:
         if not self._ready:
@@ -1,49 +1,56 @@
 from __future__ import annotations
 
 import threading
-import time
-from dataclasses import asdict
 from typing import Callable, Optional
 
-from donation_media_hub.config import POLL_INTERVAL_SEC
+from donation_media_hub.config import POLL_INTERVAL_SEC, POLL_MAX_INTERVAL_SEC
+from donation_media_hub.models import LogEvent, NewTracksEvent, UIEvent
 from donation_media_hub.services.donation_alerts import DonationAlertsClient
 from donation_media_hub.services.donatex import DonateXClient
+from donation_media_hub.title_cache import TitleCache
 
 
 class Pollers:
     """
-    Runs DA/DX polling in background threads and emits UI events via callback.
+    Runs DA/DX polling in one background thread and emits UI events via callback.
+
+    Events are slotted records from models (LogEvent / NewTracksEvent);
+    NewTracksEvent carries one poll's batch of Track instances as-is.
     """
 
     def __init__(
         self,
-        emit_event: Callable[[dict], None],
+        emit_event: Callable[[UIEvent], None],
         get_da_token: Callable[[], str],
         get_dx_token: Callable[[], str],
         da_last_media_id: int,
         dx_last_timestamp: Optional[float],
+        title_cache: Optional[TitleCache] = None,
     ) -> None:
         self.emit_event = emit_event
         self.get_da_token = get_da_token
         self.get_dx_token = get_dx_token
 
         self.da_client = DonationAlertsClient(get_da_token(), da_last_media_id)
-        self.dx_client = DonateXClient(get_dx_token(), dx_last_timestamp)
+        self.dx_client = DonateXClient(
+            get_dx_token(), dx_last_timestamp, title_cache=title_cache
+        )
 
         self._stop_event = threading.Event()
         self._threads: list[threading.Thread] = []
 
     def start(self) -> None:
-        self._stop_event.clear()
+        # fresh event per run: a loop from a previous Stop→Start never resumes
+        self._stop_event = threading.Event()
         self._threads = []
 
-        if self.get_da_token().strip():
-            th = threading.Thread(target=self._loop_da, daemon=True)
-            th.start()
-            self._threads.append(th)
-
-        if self.get_dx_token().strip():
-            th = threading.Thread(target=self._loop_dx, daemon=True)
+        if self.get_da_token().strip() or self.get_dx_token().strip():
+            th = threading.Thread(
+                target=self._loop,
+                args=(self._stop_event,),
+                daemon=True,
+                name="pollers",
+            )
             th.start()
             self._threads.append(th)
 
@@ -59,22 +66,37 @@ class Pollers:
             "dx_last_timestamp": self.dx_client.last_timestamp,
         }
 
-    def _loop_da(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                self.da_client.token = self.get_da_token().strip()
-                for t in self.da_client.fetch_new_tracks():
-                    self.emit_event({"type": "new_track", "track": asdict(t)})
-            except Exception as e:
-                self.emit_event({"type": "log", "msg": f"❌ DA error: {e}"})
-            time.sleep(POLL_INTERVAL_SEC)
-
-    def _loop_dx(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                self.dx_client.token = self.get_dx_token().strip()
-                for t in self.dx_client.fetch_new_tracks():
-                    self.emit_event({"type": "new_track", "track": asdict(t)})
-            except Exception as e:
-                self.emit_event({"type": "log", "msg": f"❌ DonateX error: {e}"})
-            time.sleep(POLL_INTERVAL_SEC)
+    def _poll_da(self) -> int:
+        try:
+            self.da_client.token = self.get_da_token().strip()
+            tracks = list(self.da_client.fetch_new_tracks())
+        except Exception as e:
+            self.emit_event(LogEvent(f"❌ DA error: {e}"))
+            return 0
+        if tracks:
+            self.emit_event(NewTracksEvent(tracks))
+        return len(tracks)
+
+    def _poll_dx(self) -> int:
+        try:
+            self.dx_client.token = self.get_dx_token().strip()
+            tracks = list(self.dx_client.fetch_new_tracks())
+        except Exception as e:
+            self.emit_event(LogEvent(f"❌ DonateX error: {e}"))
+            return 0
+        if tracks:
+            self.emit_event(NewTracksEvent(tracks))
+        return len(tracks)
+
+    def _loop(self, stop_event: threading.Event) -> None:
+        """
+        One thread for both services; idle rounds back off exponentially
+        (capped at POLL_MAX_INTERVAL_SEC), any new track resets the delay.
+        """
+        empty_streak = 0
+        while not stop_event.is_set():
+            got = self._poll_da() + self._poll_dx()
+            empty_streak = 0 if got else min(empty_streak + 1, 16)
+            delay = min(POLL_INTERVAL_SEC * 2**empty_streak, POLL_MAX_INTERVAL_SEC)
+            if stop_event.wait(delay):
+                break
@@ -1,12 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import os
+import threading
+from dataclasses import MISSING, fields
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from donation_media_hub.config import QUEUE_LIMIT
 from donation_media_hub.models import Track
-from donation_media_hub.storage import load_json, save_json
+from donation_media_hub.storage import dump_json_bytes, load_json, save_json_bytes
+
+_TRACK_FIELDS = frozenset(f.name for f in fields(Track))
+_TRACK_REQUIRED = frozenset(
+    f.name
+    for f in fields(Track)
+    if f.default is MISSING and f.default_factory is MISSING
+)
+
+# soft dedupe: same url within this many seconds is treated as one donation
+DEDUPE_WINDOW_SEC = 2.0
+
+# bursts of mutations within this window collapse into a single queue.json write
+SAVE_DEBOUNCE_SEC = 0.5
+
+
+def _unlink_all(paths: Iterable[str]) -> None:
+    # raw os.unlink: no Path object, no exists() stat; a missing file is fine
+    for p in paths:
+        try:
+            os.unlink(p)
+        except OSError:
+            pass
+
+
+def _url_bucket(url: str, created_ts: float) -> Tuple[str, int]:
+    return url, int(created_ts // DEDUPE_WINDOW_SEC)
 
 
 class QueueManager:
@@ -15,40 +43,138 @@ class QueueManager:
         self.tracks: List[Track] = []
         self.current_track_id: Optional[str] = None
 
+        # indexes over self.tracks, kept in sync by every mutating method
+        self._by_id: Dict[str, Track] = {}
+        self._by_url_ts: Dict[Tuple[str, int], List[Track]] = {}
+        self._current_index: int = -1
+        # bumped on every membership/order/current-track change, so readers
+        # (the download loop) can tell "nothing moved" without rescanning
+        self.version = 0
+        # held by every public mutator; worker threads (download loop, queue
+        # save timer) read through snapshot()/current_window() under it
+        self._lock = threading.RLock()
+
+        self._last_saved: Optional[bytes] = None
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+
     def load(self) -> None:
         data = load_json(self._queue_file, {"tracks": [], "current_track_id": None})
-        self.tracks = []
-        for raw in data.get("tracks", []):
-            try:
-                self.tracks.append(Track(**raw))
-            except Exception:
-                continue
-        self.current_track_id = data.get("current_track_id")
+        try:
+            raws = data.get("tracks", []) or []
+            self.tracks = [
+                Track(**r)
+                for r in raws
+                if isinstance(r, dict) and _TRACK_REQUIRED <= r.keys() <= _TRACK_FIELDS
+            ]
+            self.current_track_id = data.get("current_track_id")
+        except Exception:
+            self.tracks = []
+            self.current_track_id = None
+        self._rebuild_index()
         self.sort()
         self._ensure_current()
 
     def save(self) -> None:
-        save_json(
-            self._queue_file,
+        payload = dump_json_bytes(
             {
-                "tracks": [asdict(t) for t in self.tracks],
+                "tracks": self.snapshot(),
                 "current_track_id": self.current_track_id,
-            },
+            }
         )
+        # unchanged since the last write (e.g. a no-op status flip): skip the disk
+        if payload == self._last_saved:
+            return
+        if save_json_bytes(self._queue_file, payload):
+            self._last_saved = payload
+
+    def request_save(self) -> None:
+        """
+        Debounced save: marks the queue dirty and writes once the burst settles.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SEC, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush(self) -> None:
+        with self._save_lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.save()
+
+    def flush_now(self) -> None:
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = None
+            self._dirty = False
+            self.save()
 
     def sort(self) -> None:
-        self.tracks.sort(key=lambda t: t.created_ts)
+        with self._lock:
+            self.tracks.sort(key=lambda t: t.created_ts)
+            self._update_current_index()
 
-    def _ensure_current(self) -> None:
-        if self.current_track_id and self.get(self.current_track_id):
+    # -------------------- index --------------------
+    def _rebuild_index(self) -> None:
+        self._by_id = {}
+        self._by_url_ts = {}
+        for t in self.tracks:
+            self._index_add(t)
+
+    def _index_add(self, track: Track) -> None:
+        self._by_id[track.track_id] = track
+        key = _url_bucket(track.url, track.created_ts)
+        self._by_url_ts.setdefault(key, []).append(track)
+
+    def _index_remove(self, track: Track) -> None:
+        self._by_id.pop(track.track_id, None)
+        key = _url_bucket(track.url, track.created_ts)
+        bucket = self._by_url_ts.get(key)
+        if bucket is None:
             return
-        self.current_track_id = self.tracks[0].track_id if self.tracks else None
+        bucket[:] = [t for t in bucket if t is not track]
+        if not bucket:
+            del self._by_url_ts[key]
+
+    def _is_soft_duplicate(self, track: Track) -> bool:
+        url, b = _url_bucket(track.url, track.created_ts)
+        for key in ((url, b - 1), (url, b), (url, b + 1)):
+            for t in self._by_url_ts.get(key, ()):
+                if abs(t.created_ts - track.created_ts) <= DEDUPE_WINDOW_SEC:
+                    return True
+        return False
+
+    def _update_current_index(self) -> None:
+        cur = self._by_id.get(self.current_track_id) if self.current_track_id else None
+        if cur is None:
+            self._current_index = -1
+            return
+        # common case (append at the tail, re-sort of sorted data): still valid
+        i = self._current_index
+        if 0 <= i < len(self.tracks) and self.tracks[i] is cur:
+            return
+        self._current_index = -1
+        for i, t in enumerate(self.tracks):
+            if t is cur:
+                self._current_index = i
+                return
+
+    def _ensure_current(self) -> None:
+        self.version += 1
+        if not (self.current_track_id and self.current_track_id in self._by_id):
+            self.current_track_id = self.tracks[0].track_id if self.tracks else None
+        self._update_current_index()
 
     def get(self, track_id: str) -> Optional[Track]:
-        for t in self.tracks:
-            if t.track_id == track_id:
-                return t
-        return None
+        return self._by_id.get(track_id)
 
     def current(self) -> Optional[Track]:
         if not self.current_track_id:
@@ -56,24 +182,43 @@ class QueueManager:
         return self.get(self.current_track_id)
 
     def set_current(self, track_id: Optional[str]) -> None:
-        self.current_track_id = track_id
-        self._ensure_current()
+        with self._lock:
+            self.current_track_id = track_id
+            self._ensure_current()
 
     def append_if_new(self, track: Track) -> bool:
-        if any(t.track_id == track.track_id for t in self.tracks):
-            return False
-        # soft dedupe
-        for t in self.tracks:
-            if t.url == track.url and abs(t.created_ts - track.created_ts) <= 2.0:
-                return False
+        return bool(self.append_many([track]))
 
-        self.tracks.append(track)
-        self.sort()
-        self._trim()
-        self._ensure_current()
-        return True
+    def append_many(self, tracks: Iterable[Track]) -> List[Track]:
+        """
+        Appends every track that isn't a duplicate; sorts (only if needed)
+        and trims once. Returns the tracks actually added.
+        """
+        with self._lock:
+            added: List[Track] = []
+            # new donations normally arrive newest-last: then tracks stays sorted
+            tail = self.tracks[-1].created_ts if self.tracks else float("-inf")
+            in_order = True
+            for track in tracks:
+                if track.track_id in self._by_id or self._is_soft_duplicate(track):
+                    continue
+                if track.created_ts < tail:
+                    in_order = False
+                else:
+                    tail = track.created_ts
+                self.tracks.append(track)
+                self._index_add(track)
+                added.append(track)
+
+            if added:
+                if not in_order:
+                    self.sort()
+                self._trim()
+                self._ensure_current()
+            return added
 
     def _trim(self) -> None:
+        # expects self.tracks sorted by created_ts (append_many guarantees it)
         if len(self.tracks) <= QUEUE_LIMIT:
             return
 
@@ -86,25 +231,44 @@ class QueueManager:
                 return False
             return True
 
-        self.sort()
-        while len(self.tracks) > QUEUE_LIMIT:
-            idx = next((i for i, t in enumerate(self.tracks) if removable(t)), None)
-            if idx is None:
-                break
-            victim = self.tracks.pop(idx)
-            if victim.local_path:
-                try:
-                    Path(victim.local_path).unlink(missing_ok=True)
-                except Exception:
-                    pass
+        over = len(self.tracks) - QUEUE_LIMIT
+        keep: List[Track] = []
+        victims: List[Track] = []
+        # oldest removable first: walk sorted order once, partitioning as we go
+        for t in self.tracks:
+            if len(victims) < over and removable(t):
+                victims.append(t)
+            else:
+                keep.append(t)
+        if not victims:
+            return
+
+        self.tracks[:] = keep
+        for victim in victims:
+            self._index_remove(victim)
+        # a repeated link shares one mp3: keep it while a remaining track uses it
+        in_use = {t.local_path for t in keep if t.local_path}
+        _unlink_all(
+            v.local_path for v in victims if v.local_path and v.local_path not in in_use
+        )
+
+    def snapshot(self) -> Tuple[Track, ...]:
+        with self._lock:
+            return tuple(self.tracks)
+
+    def current_window(self, size: int) -> Tuple[Track, ...]:
+        """
+        The current track and up to size-1 tracks after it, as one consistent
+        snapshot; empty when nothing is current.
+        """
+        with self._lock:
+            i = self._current_index
+            if i < 0:
+                return ()
+            return tuple(self.tracks[i : i + size])
 
     def index_of_current(self) -> int:
-        if not self.current_track_id:
-            return -1
-        for i, t in enumerate(self.tracks):
-            if t.track_id == self.current_track_id:
-                return i
-        return -1
+        return self._current_index
 
     def next_id(self) -> Optional[str]:
         i = self.index_of_current()
@@ -121,11 +285,13 @@ class QueueManager:
         return self.tracks[i - 1].track_id
 
     def clear(self) -> None:
-        for t in self.tracks:
-            if t.local_path:
-                try:
-                    Path(t.local_path).unlink(missing_ok=True)
-                except Exception:
-                    pass
-        self.tracks.clear()
-        self.current_track_id = None
+        with self._lock:
+            paths = [t.local_path for t in self.tracks if t.local_path]
+            self.tracks.clear()
+            self._by_id.clear()
+            self._by_url_ts.clear()
+            self.current_track_id = None
+            self._current_index = -1
+            self.version += 1
+        # outside the lock: the download loop needn't wait on the filesystem
+        _unlink_all(paths)
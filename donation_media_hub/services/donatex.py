@@ -1,70 +1,167 @@
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Iterable, Optional
 
-import requests
-
-from donation_media_hub.config import DX_API_URL, USER_AGENT
+from donation_media_hub.config import (
+    DX_API_URL,
+    DX_CONDITIONAL_POLL,
+    HTTP_CONNECT_TIMEOUT,
+    OEMBED_WORKERS,
+)
+from donation_media_hub.http import SESSION
 from donation_media_hub.models import Track
 from donation_media_hub.services.youtube import is_youtube_url, youtube_oembed_title
+from donation_media_hub.storage import json_loads
+from donation_media_hub.title_cache import TitleCache
 
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
+# each poll re-reads the newest `take` donations: most timestamps repeat
+@lru_cache(maxsize=256)
 def parse_iso_ts(ts: str) -> float:
+    # fast path for the API's own shape: 2024-01-31T12:34:56[.123456]Z. The
+    # separators are checked and datetime() validates every field, so anything
+    # off-shape or out of range (Feb 30, :60) falls through to fromisoformat.
+    if (
+        len(ts) >= 20
+        and ts[-1] == "Z"
+        and ts[4] == "-"
+        and ts[7] == "-"
+        and ts[10] == "T"
+        and ts[13] == ":"
+        and ts[16] == ":"
+    ):
+        digits = ts[0:4] + ts[5:7] + ts[8:10] + ts[11:13] + ts[14:16] + ts[17:19]
+        frac = ts[19:-1]
+        us = frac[1:]
+        if (
+            digits.isascii()
+            and digits.isdigit()
+            and (
+                not frac
+                or (
+                    frac[0] == "."
+                    and 1 <= len(us) <= 6
+                    and us.isascii()
+                    and us.isdigit()
+                )
+            )
+        ):
+            try:
+                return datetime(
+                    int(ts[0:4]),
+                    int(ts[5:7]),
+                    int(ts[8:10]),
+                    int(ts[11:13]),
+                    int(ts[14:16]),
+                    int(ts[17:19]),
+                    int(us.ljust(6, "0")) if us else 0,
+                    tzinfo=timezone.utc,
+                ).timestamp()
+            except ValueError:
+                pass
     return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
 
 
+def _fetch_titles(urls: list[str]) -> dict[str, str]:
+    """
+    oEmbed titles for urls, up to OEMBED_WORKERS requests side by side. Daemon
+    threads (not a ThreadPoolExecutor, whose workers are joined at exit), so a
+    lookup in flight never keeps the app alive after the window closes.
+    """
+    pending = list(urls)
+    out: dict[str, str] = {}
+
+    def work() -> None:
+        while True:
+            try:
+                url = pending.pop()
+            except IndexError:
+                return
+            title = youtube_oembed_title(url)  # None on any error
+            if title:
+                out[url] = title
+
+    threads = [
+        threading.Thread(target=work, daemon=True, name=f"oembed-{i}")
+        for i in range(min(OEMBED_WORKERS, len(pending)))
+    ]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    return out
+
+
 class DonateXClient:
-    def __init__(self, token: str, last_timestamp: Optional[float] = None) -> None:
+    def __init__(
+        self,
+        token: str,
+        last_timestamp: Optional[float] = None,
+        title_cache: Optional[TitleCache] = None,
+    ) -> None:
         self.token = token
         self.last_timestamp = float(last_timestamp) if last_timestamp else None
-        self._title_cache: dict[str, str] = {}
+        self._title_cache = title_cache
+        self._session = SESSION
+
+        # cache validators from the last 200, valid only for the token they came with
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._validators_token: Optional[str] = None
 
     def fetch_new_tracks(self) -> Iterable[Track]:
         if not self.token:
             return []
 
-        headers = {
-            "accept": "application/json",
-            "x-external-token": self.token,
-            "user-agent": USER_AGENT,
-        }
+        headers = {"accept": "application/json", "x-external-token": self.token}
+        if DX_CONDITIONAL_POLL and self._validators_token == self.token:
+            if self._etag:
+                headers["if-none-match"] = self._etag
+            if self._last_modified:
+                headers["if-modified-since"] = self._last_modified
         params = {"skip": 0, "take": 20, "hideTest": "true", "withAi": "true"}
 
-        r = requests.get(DX_API_URL, headers=headers, params=params, timeout=15)
+        r = self._session.get(
+            DX_API_URL,
+            headers=headers,
+            params=params,
+            timeout=(HTTP_CONNECT_TIMEOUT, 15),
+        )
+        if r.status_code == 304:
+            return []
         r.raise_for_status()
 
-        data = r.json()
+        self._etag = r.headers.get("etag")
+        self._last_modified = r.headers.get("last-modified")
+        self._validators_token = self.token
+
+        data = json_loads(r.content)
         donations = data.get("donations", []) or []
         if not donations:
             return []
 
-        donations.sort(key=lambda d: parse_iso_ts(d.get("timestamp", now_iso())))
+        parsed = [
+            (parse_iso_ts(d["timestamp"]), d) for d in donations if d.get("timestamp")
+        ]
+        parsed.sort(key=lambda x: x[0])
+        if self.last_timestamp is not None:
+            parsed = [(ts, d) for ts, d in parsed if ts > self.last_timestamp]
+        titles = self._lookup_titles(
+            {d["musicLink"] for _ts, d in parsed if d.get("musicLink")}
+        )
         out: list[Track] = []
 
         updated_last = self.last_timestamp
-        for d in donations:
-            ts_str = d.get("timestamp")
-            if not ts_str:
-                continue
-            ts = parse_iso_ts(ts_str)
-            if self.last_timestamp is not None and ts <= self.last_timestamp:
-                continue
-
+        for ts, d in parsed:
+            ts_str = d["timestamp"]
             url = d.get("musicLink")
             if not url:
                 continue
 
-            if url in self._title_cache:
-                title = self._title_cache[url]
-            else:
-                title = youtube_oembed_title(url) if is_youtube_url(url) else None
-                title = title or "Track"
-                self._title_cache[url] = title
+            title = titles.get(url) or "Track"
 
             stable_suffix = d.get("id") or ts_str
             track_id = f"DX:{stable_suffix}"
@@ -85,3 +182,25 @@ class DonateXClient:
         if updated_last is not None:
             self.last_timestamp = float(updated_last)
         return out
+
+    def _lookup_titles(self, urls: set[str]) -> dict[str, str]:
+        """
+        Cached titles first; the YouTube misses are fetched concurrently
+        (one oEmbed round-trip per batch instead of one per donation).
+        """
+        titles: dict[str, str] = {}
+        misses: list[str] = []
+        for url in urls:
+            title = self._title_cache.get(url) if self._title_cache else None
+            if title is not None:
+                titles[url] = title
+            elif is_youtube_url(url):
+                misses.append(url)
+        if not misses:
+            return titles
+
+        fetched = _fetch_titles(misses)
+        if fetched and self._title_cache:
+            self._title_cache.put_many(fetched)
+        titles.update(fetched)
+        return titles
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-import json
 import re
 import time
 from datetime import datetime, timezone
 from typing import Iterable, Optional
 
-import requests
-
-from donation_media_hub.config import DA_MEDIA_URL, USER_AGENT
+from donation_media_hub.config import DA_MEDIA_URL, HTTP_CONNECT_TIMEOUT
+from donation_media_hub.http import SESSION
 from donation_media_hub.models import Track
+from donation_media_hub.storage import json_loads
+
+_JSONP_RE = re.compile(r"\((\{.*\})\)\s*$", re.S)
 
 
 def _jsonp_to_json(text: str) -> Optional[dict]:
-    m = re.search(r"\((\{.*\})\)\s*$", text, re.S)
+    m = _JSONP_RE.search(text)
     if not m:
         return None
     try:
-        return json.loads(m.group(1))
+        return json_loads(m.group(1))
     except Exception:
         return None
 
@@ -26,6 +27,7 @@ class DonationAlertsClient:
     def __init__(self, token: str, last_media_id: int = 0) -> None:
         self.token = token
         self.last_media_id = int(last_media_id or 0)
+        self._session = SESSION
 
     def fetch_new_tracks(self) -> Iterable[Track]:
         if not self.token:
@@ -34,11 +36,8 @@ class DonationAlertsClient:
         ts_ms = int(time.time() * 1000)
         params = {"callback": f"jQuery{ts_ms}", "token": self.token, "_": ts_ms}
 
-        r = requests.get(
-            DA_MEDIA_URL,
-            params=params,
-            timeout=15,
-            headers={"user-agent": USER_AGENT},
+        r = self._session.get(
+            DA_MEDIA_URL, params=params, timeout=(HTTP_CONNECT_TIMEOUT, 15)
         )
         r.raise_for_status()
 
@@ -63,7 +62,7 @@ class DonationAlertsClient:
 
             add_raw = media.get("additional_data") or ""
             try:
-                add = json.loads(add_raw) if add_raw else {}
+                add = json_loads(add_raw) if add_raw else {}
             except Exception:
                 add = {}
 
@@ -76,7 +75,8 @@ class DonationAlertsClient:
             created_str = media.get("date_created")
             if created_str:
                 try:
-                    dt = datetime.strptime(created_str, "%Y-%m-%d %H:%M:%S")
+                    # "YYYY-MM-DD HH:MM:SS" (UTC); much cheaper than strptime
+                    dt = datetime.fromisoformat(created_str)
                     created_ts = dt.replace(tzinfo=timezone.utc).timestamp()
                 except Exception:
                     created_ts = time.time()
@@ -2,33 +2,47 @@ from __future__ import annotations
 
 import re
 from typing import Optional
+from urllib.parse import urlsplit
 
 import requests
 
-from donation_media_hub.config import USER_AGENT
+from donation_media_hub.config import HTTP_CONNECT_TIMEOUT
+from donation_media_hub.http import SESSION
+
+_BAD_CHARS = re.compile(r'[\\/:*?"<>|\n\r\t]+')
+_WS = re.compile(r"\s+")
+_YT_HOST_RE = re.compile(r"(?:^|\.)(?:youtube\.com|youtu\.be)$", re.I)
 
 
 def is_youtube_url(url: str) -> bool:
-    u = (url or "").lower()
-    return "youtube.com" in u or "youtu.be" in u
+    url = (url or "").strip()
+    try:
+        # links pasted without a scheme ("youtu.be/…") still carry a host
+        host = urlsplit(url if "//" in url else "//" + url).hostname
+    except ValueError:
+        return False
+    return bool(host and _YT_HOST_RE.search(host))
 
 
 def sanitize_filename(name: str, max_len: int = 120) -> str:
     name = (name or "").strip()
-    name = re.sub(r'[\\/:*?"<>|\n\r\t]+', "_", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _BAD_CHARS.sub("_", name)
+    name = _WS.sub(" ", name).strip()
     if len(name) > max_len:
         name = name[:max_len].rstrip()
     return name or "track"
 
 
-def youtube_oembed_title(url: str, timeout: int = 10) -> Optional[str]:
+def youtube_oembed_title(
+    url: str,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None,
+) -> Optional[str]:
     try:
-        r = requests.get(
+        r = (session or SESSION).get(
             "https://www.youtube.com/oembed",
             params={"url": url, "format": "json"},
-            timeout=timeout,
-            headers={"user-agent": USER_AGENT},
+            timeout=(HTTP_CONNECT_TIMEOUT, timeout),
         )
         if r.status_code != 200:
             return None
@@ -1,24 +1,70 @@
 from __future__ import annotations
 
+import dataclasses
 import json
+import os
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+
+def json_loads(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def load_json(path: Path, default: Any) -> Any:
     if not path.exists():
         return default
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return json_loads(path.read_bytes())
     except Exception:
         return default
 
 
-def save_json(path: Path, data: Any) -> None:
+def _json_default(obj: Any) -> Any:
+    # stdlib fallback for what orjson encodes natively
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """
+    Dataclass instances may be passed as-is: orjson serializes them in C,
+    without the per-object asdict() deep copy.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2, default=_json_default).encode(
+        "utf-8"
+    )
+
+
+def save_json_bytes(path: Path, payload: bytes) -> bool:
+    tmp = path.with_suffix(path.suffix + ".tmp")
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # write next to the target, then swap: readers never see a half-written file
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        return True
     except Exception:
         # Intentionally silent to avoid crashing UI on disk errors.
-        pass
+        try:
+            tmp.unlink(missing_ok=True)
+        except Exception:
+            pass
+        return False
+
+
+def save_json(path: Path, data: Any) -> None:
+    try:
+        payload = dump_json_bytes(data)
+    except Exception:
+        return
+    save_json_bytes(path, payload)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from donation_media_hub.storage import load_json, save_json
+
+
+class TitleCache:
+    """
+    Persistent url -> title LRU, so oEmbed lookups survive restarts.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 1000) -> None:
+        self._path = path
+        self._max_entries = max_entries
+        self._data: Optional[OrderedDict[str, str]] = None
+
+    def _entries(self) -> OrderedDict[str, str]:
+        if self._data is None:
+            raw = load_json(self._path, {})
+            self._data = OrderedDict()
+            if isinstance(raw, dict):
+                for url, title in raw.items():
+                    if url and title:
+                        self._data[str(url)] = str(title)
+        return self._data
+
+    def get(self, url: str) -> Optional[str]:
+        data = self._entries()
+        title = data.get(url)
+        if title is not None:
+            data.move_to_end(url)
+        return title
+
+    def put(self, url: str, title: str) -> None:
+        self.put_many({url: title})
+
+    def put_many(self, titles: dict[str, str]) -> None:
+        # one file write for the whole batch
+        data = self._entries()
+        for url, title in titles.items():
+            data[url] = title
+            data.move_to_end(url)
+        while len(data) > self._max_entries:
+            data.popitem(last=False)
+        save_json(self._path, data)
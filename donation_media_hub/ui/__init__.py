@@ -1 +1 @@
-__all__ = ["main_window", "theme", "dialogs"]
+__all__ = ["main_window", "dialogs"]
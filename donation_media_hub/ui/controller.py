@@ -1,20 +1,40 @@
 from __future__ import annotations
 
-import queue as thread_queue
+import os
 import shutil
 import threading
 import time
 import webbrowser
+from collections import deque
+from queue import SimpleQueue
 from pathlib import Path
 from typing import Optional
 
+from donation_media_hub.config import DOWNLOAD_LOOKAHEAD
 from donation_media_hub.downloader import Downloader
-from donation_media_hub.models import Track
-from donation_media_hub.paths import TEMP_DIR
+from donation_media_hub.models import (
+    DownloadDoneEvent,
+    LogEvent,
+    NewTracksEvent,
+    Track,
+    TrackStatusEvent,
+    UIEvent,
+)
+from donation_media_hub.paths import TEMP_DIR, TITLE_CACHE_FILE
 from donation_media_hub.playback import AudioPlayer
 from donation_media_hub.pollers import Pollers
 from donation_media_hub.queue_manager import QueueManager
-from donation_media_hub.storage import load_json, save_json
+from donation_media_hub.storage import dump_json_bytes, load_json, save_json_bytes
+from donation_media_hub.title_cache import TitleCache
+
+# config.json / poller state changes within this window are written once
+CONFIG_FLUSH_SEC = 0.25
+# max events handled per process_ui_events() call; the rest waits for the next
+UI_EVENT_BATCH = 64
+# cached local_path existence is re-checked after this long (files deleted by hand)
+PATH_EXISTS_TTL_SEC = 2.0
+# a link whose download failed is not retried automatically for this long
+DOWNLOAD_RETRY_SEC = 60.0
 
 
 class PlayerController:
@@ -39,6 +59,8 @@ class PlayerController:
         "skipped": 4,
         "failed": 4,
     }
+    # legacy status spellings folded on the way in
+    STATUS_ALIASES = {"ready": "queued"}
 
     # -------------------- init --------------------
     def __init__(
@@ -52,6 +74,8 @@ class PlayerController:
         on_status_text,  # (str) -> None
         on_now_playing,  # (big:str, small:str) -> None
         set_current_in_view,  # (track_id:str|None) -> None
+        on_events_pending=None,  # () -> None; must be callable from any thread
+        on_watchdog_active=None,  # (bool) -> None; arm/disarm the watchdog tick
     ) -> None:
         self.queue = queue_manager
         self.config_file = config_file
@@ -63,9 +87,33 @@ class PlayerController:
         self.on_status_text = on_status_text
         self.on_now_playing = on_now_playing
         self.set_current_in_view = set_current_in_view
-
-        self.ui_events: "thread_queue.Queue[dict]" = thread_queue.Queue()
+        self.on_watchdog_active = on_watchdog_active or (lambda _on: None)
+        # last values pushed to the UI labels
+        self._last_now_playing: Optional[tuple[str, str]] = None
+        self._now_playing_key: Optional[tuple] = None
+        self._last_status_text: Optional[str] = None
+
+        # producers (poller/download threads) append, the UI thread popleft()s;
+        # both are atomic on a deque, so no lock or Empty exception is needed
+        self.ui_events: "deque[UIEvent]" = deque()
+        # producers ask the UI thread for one drain per burst, not one per event
+        self.on_events_pending = on_events_pending or (lambda: None)
+        self._drain_scheduled = False
+        # event class -> bound handler; one dict hit per event instead of an elif chain
+        self._ev_handlers = {
+            LogEvent: self._on_log_event,
+            NewTracksEvent: self._on_new_tracks,
+            TrackStatusEvent: self._on_track_status,
+            DownloadDoneEvent: self._on_download_done,
+        }
         self._closing = False
+
+        # write-behind for config.json and poller state
+        # (queue.json debounces inside QueueManager)
+        self._dirty_config = False
+        self._dirty_states = False
+        self._flush_lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
         self._last_play_start_ts: float = 0.0
 
         # ---- controller-owned config cache ----
@@ -77,6 +125,8 @@ class PlayerController:
         self.config_data: dict = {}
         self.da_state: dict = {}
         self.dx_state: dict = {}
+        # path -> bytes last written there; identical snapshots skip the disk
+        self._last_written: dict[Path, bytes] = {}
 
         self._load_config()
         self._load_states()
@@ -85,13 +135,44 @@ class PlayerController:
         self.player = AudioPlayer(volume=self._volume)
 
         self.pollers = Pollers(
-            emit_event=self.ui_events.put,
+            emit_event=self._emit,
             get_da_token=lambda: self._da_token,
             get_dx_token=lambda: self._dx_token,
             da_last_media_id=int(self.da_state.get("last_media_id", 0) or 0),
             dx_last_timestamp=self.dx_state.get("last_timestamp"),
+            title_cache=TitleCache(TITLE_CACHE_FILE),
         )
 
+        # local_path -> (exists, expires_at); dropped whenever we delete files
+        # ourselves, otherwise re-stat'ed once the TTL runs out
+        self._path_exists_cache: dict[str, tuple[bool, float]] = {}
+        # local_path -> tracks using it, so cleanup can detach deleted files
+        # directly; a repeated link shares one file (see Downloader._claim_path).
+        # local_path is kept canonical (realpath'd once) so it matches cleanup_keep.
+        self._path_to_track: dict[str, list[Track]] = {}
+        for t in self.queue.tracks:
+            if t.local_path:
+                t.local_path = os.path.realpath(t.local_path)
+                self._path_to_track.setdefault(t.local_path, []).append(t)
+
+        # keep set of the last temp sweep (= what temp still holds); None forces
+        # the next sweep to walk the directory
+        self._cleanup_keep_last: Optional[set[str]] = None
+
+        self._dl_wakeup = threading.Event()
+        # one worker per slot of the download window (current + lookahead).
+        # Plain daemon threads, not a ThreadPoolExecutor: its workers are joined
+        # at interpreter exit, so closing mid-download would hang until the
+        # transfer finished. None on the queue stops a worker.
+        self._dl_jobs: SimpleQueue[Optional[Track]] = SimpleQueue()
+        for i in range(1 + DOWNLOAD_LOOKAHEAD):
+            threading.Thread(
+                target=self._download_worker, daemon=True, name=f"dl-{i}"
+            ).start()
+        self._dl_inflight: set[str] = set()
+        # url -> monotonic time before which a failed download isn't retried
+        self._dl_failed: dict[str, float] = {}
+        self._dl_seen_version = -1  # queue.version of the last download scan
         self._download_thread = threading.Thread(
             target=self._download_loop,
             daemon=True,
@@ -139,7 +220,10 @@ class PlayerController:
 
         self._da_token = (da_token or "").strip()
         self._dx_token = (dx_token or "").strip()
+        turned_on = download_mode and not self._download_mode
         self._download_mode = bool(download_mode)
+        if turned_on:
+            self._rescan_downloads()
         self._volume = float(volume)
 
         self.config_data.update(
@@ -153,7 +237,33 @@ class PlayerController:
             }
         )
 
-        save_json(self.config_file, self.config_data)
+        # serialized + written on the flush timer thread, never on the GUI thread;
+        # stop()/close() flush synchronously
+        self._mark_config_dirty()
+
+    def _mark_config_dirty(self) -> None:
+        self._mark_dirty(config=True)
+
+    def _mark_dirty(self, *, config: bool = False, states: bool = False) -> None:
+        with self._flush_lock:
+            self._dirty_config |= config
+            self._dirty_states |= states
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(CONFIG_FLUSH_SEC, self._flush_dirty)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_dirty(self) -> None:
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty_config:
+                self._dirty_config = False
+                self._write_json(self.config_file, dict(self.config_data))
+            if self._dirty_states:
+                self._save_states()
 
     def set_volume(self, volume: float) -> None:
         self._volume = float(volume)
@@ -169,29 +279,45 @@ class PlayerController:
         self.dx_state = load_json(self.state_dx_file, {"last_timestamp": None})
 
     def _save_states(self) -> None:
-        snap = self.pollers.state_snapshot()
-        self.da_state["last_media_id"] = int(snap.get("da_last_media_id", 0) or 0)
-        self.dx_state["last_timestamp"] = snap.get("dx_last_timestamp")
-        save_json(self.state_da_file, self.da_state)
-        save_json(self.state_dx_file, self.dx_state)
+        with self._flush_lock:
+            self._dirty_states = False
+            snap = self.pollers.state_snapshot()
+            self.da_state["last_media_id"] = int(snap.get("da_last_media_id", 0) or 0)
+            self.dx_state["last_timestamp"] = snap.get("dx_last_timestamp")
+            self._write_json(self.state_da_file, self.da_state)
+            self._write_json(self.state_dx_file, self.dx_state)
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        try:
+            payload = dump_json_bytes(data)
+        except Exception:
+            return
+        if self._last_written.get(path) == payload:
+            return
+        if save_json_bytes(path, payload):
+            self._last_written[path] = payload
 
     # ======================================================================
     # INTERNAL HELPERS
     # ======================================================================
 
-    def _normalize_status(self, st: str) -> str:
-        return "queued" if st == "ready" else st
-
-    def _status_rank(self, st: str) -> int:
-        return int(self.STATUS_ORDER.get(st, 0))
+    def _exists(self, path: str) -> bool:
+        now = time.monotonic()
+        hit = self._path_exists_cache.get(path)
+        if hit is not None and hit[1] > now:
+            return hit[0]
+        v = os.path.exists(path)
+        self._path_exists_cache[path] = (v, now + PATH_EXISTS_TTL_SEC)
+        return v
 
     def _set_current(self, track_id: Optional[str]) -> None:
         if not track_id:
             return
         self.queue.set_current(track_id)
-        self.queue.save()
+        self._dl_wakeup.set()
+        self.queue.request_save()
         self.config_data["current_track_id"] = track_id
-        save_json(self.config_file, self.config_data)
+        self._mark_config_dirty()
         self.set_current_in_view(track_id)
         self._update_now_playing()
         self.on_ui_update()
@@ -201,6 +327,9 @@ class PlayerController:
     # ======================================================================
 
     def set_current_by_id(self, track_id: str | None) -> None:
+        # re-clicking the current row: nothing to save, select or redraw
+        if track_id == self.queue.current_track_id:
+            return
         self._set_current(track_id)
 
     def open_current_link(self) -> None:
@@ -214,7 +343,7 @@ class PlayerController:
 
     def start(self) -> None:
         if not self._da_token and not self._dx_token:
-            self.on_status_text("Ошибка: нет токенов")
+            self._set_status("Ошибка: нет токенов")
             self.on_log("❌ Вставь хотя бы один токен (DA или DX).")
             return
 
@@ -222,7 +351,8 @@ class PlayerController:
         self.pollers.dx_client.token = self._dx_token
 
         self.pollers.start()
-        self.on_status_text("Polling: ON")
+        self._rescan_downloads()
+        self._set_status("Polling: ON")
         self.on_log("▶ polling started")
 
         if self.queue.current() and not self.player.is_playing():
@@ -230,128 +360,219 @@ class PlayerController:
 
     def stop(self) -> None:
         self.pollers.stop()
-        self.on_status_text("Polling: OFF")
+        self._set_status("Polling: OFF")
         self.on_log("⏹ polling stopped")
         self._save_states()
+        self.queue.flush_now()
+        self._flush_dirty()
 
     # ======================================================================
     # EVENT PUMP
     # ======================================================================
 
+    def _emit(self, ev: UIEvent) -> None:
+        """
+        Thread-safe producer entry: queue the event and wake the UI thread.
+        """
+        self.ui_events.append(ev)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.on_events_pending()
+
     def process_ui_events(self) -> None:
         if self._closing:
             return
 
-        dirty = False
+        # cleared before draining: anything appended after this schedules anew
+        self._drain_scheduled = False
+
+        # take at most UI_EVENT_BATCH events, then dispatch through the type jump
+        # table; a flood is split across GUI loop turns so paints get in between
+        q = self.ui_events
+        pop = q.popleft
+        evs = [pop() for _ in range(min(len(q), UI_EVENT_BATCH))]
+        if q:
+            self._drain_scheduled = True
+            self.on_events_pending()
+        if not evs:
+            return
 
-        try:
-            while True:
-                ev = self.ui_events.get_nowait()
-                et = ev.get("type")
-
-                if et == "log":
-                    self.on_log(str(ev.get("msg", "")))
-
-                elif et == "new_track":
-                    t = Track(**ev["track"])
-                    if self.queue.append_if_new(t):
-                        self.queue.sort()
-                        self.on_log(f"➕ NEW [{t.source}] {t.title}")
-                        if self.queue.current_track_id is None:
-                            self._set_current(t.track_id)
-                        dirty = True
-
-                elif et == "track_status":
-                    t = self.queue.get(ev.get("track_id"))
-                    if not t:
-                        continue
-                    st = self._normalize_status(ev.get("status", t.status))
-                    if self._status_rank(st) < self._status_rank(t.status):
-                        continue
-                    t.status = st
-                    if ev.get("error"):
-                        t.error = str(ev["error"])
-                    dirty = True
-
-                elif et == "download_done":
-                    t = self.queue.get(ev.get("track_id"))
-                    if not t:
-                        continue
-                    t.local_path = str(ev.get("path"))
-                    if t.status not in {"playing", "paused"}:
-                        t.status = "queued"
-                    dirty = True
-                    if (
-                        t.track_id == self.queue.current_track_id
-                        and self._download_mode
-                        and not self.player.is_playing()
-                    ):
-                        self.play_current(force=True)
-
-        except thread_queue.Empty:
-            pass
+        if len(evs) > 1:
+            evs = self._coalesce_status_events(evs)
+
+        handlers = self._ev_handlers
+        dirty = False
+        for ev in evs:
+            h = handlers.get(type(ev))
+            if h is not None and h(ev):
+                dirty = True
 
+        # one save + one redraw per batch, however many events it held
         if dirty:
-            self.queue.save()
+            self.queue.request_save()
             self._update_now_playing()
             self.on_ui_update()
 
+    def _coalesce_status_events(self, evs: list) -> list:
+        """
+        Drop TrackStatusEvents that a later one for the same track supersedes
+        (same or higher rank, no download_done in between). Applying only the
+        survivors in order gives the same final state as applying them all.
+        """
+        rank = self.STATUS_ORDER.get
+        norm = self.STATUS_ALIASES.get
+        next_rank: dict[str, int] = {}  # track_id -> rank of the next kept status
+        kept = []
+        for ev in reversed(evs):
+            cls = type(ev)
+            if cls is TrackStatusEvent:
+                r = rank(norm(ev.status, ev.status), 0)
+                nxt = next_rank.get(ev.track_id)
+                if nxt is not None and nxt >= r and not ev.error:
+                    continue
+                next_rank[ev.track_id] = r
+            elif cls is DownloadDoneEvent:
+                next_rank.pop(ev.track_id, None)
+            kept.append(ev)
+        kept.reverse()
+        return kept
+
+    # ---- event handlers: each returns True if queue state changed ----
+
+    def _on_log_event(self, ev: LogEvent) -> bool:
+        self.on_log(ev.msg)
+        return False
+
+    def _on_new_tracks(self, ev: NewTracksEvent) -> bool:
+        added = self.queue.append_many(ev.tracks)
+        if not added:
+            return False
+        log = self.on_log
+        for t in added:
+            log(f"➕ NEW [{t.source}] {t.title}")
+        self._dl_wakeup.set()
+        # pollers advanced their cursors: persist them soon, not only on stop
+        self._mark_dirty(states=True)
+        if self.queue.current_track_id is None:
+            self._set_current(added[0].track_id)
+        return True
+
+    def _on_track_status(self, ev: TrackStatusEvent) -> bool:
+        t = self.queue.get(ev.track_id)
+        if not t:
+            return False
+        rank = self.STATUS_ORDER.get
+        st = self.STATUS_ALIASES.get(ev.status, ev.status)
+        if rank(st, 0) < rank(t.status, 0):
+            return False
+        # an echo of the current state: nothing to save or redraw
+        if st == t.status and (not ev.error or ev.error == t.error):
+            return False
+        t.status = st
+        if ev.error:
+            t.error = ev.error
+        return True
+
+    def _on_download_done(self, ev: DownloadDoneEvent) -> bool:
+        # a file landed in temp, even if its track was trimmed/cleared while it
+        # downloaded: the next cleanup must walk the directory to see it
+        self._cleanup_keep_last = None
+        t = self.queue.get(ev.track_id)
+        if not t:
+            return False
+        # already a canonical str, resolved on the download thread
+        changed = t.local_path != ev.path
+        t.local_path = ev.path
+        expires = time.monotonic() + PATH_EXISTS_TTL_SEC
+        self._path_exists_cache[t.local_path] = (True, expires)
+        owners = self._path_to_track.setdefault(t.local_path, [])
+        if t not in owners:
+            owners.append(t)
+        if t.status not in {"playing", "paused", "queued"}:
+            t.status = "queued"
+            changed = True
+        if (
+            t.track_id == self.queue.current_track_id
+            and self._download_mode
+            and not self.player.is_playing()
+        ):
+            self.play_current(force=True)
+        return changed
+
     # ======================================================================
     # DOWNLOAD LOOP
     # ======================================================================
 
     def _download_loop(self) -> None:
+        emit = self._emit
         while True:
-            time.sleep(0.25)
-
-            if (
-                self._closing
-                or not self._download_mode
-                or not self.pollers.is_running()
-            ):
+            # woken by start / current-track change / new tracks / mode toggle;
+            # the timeout is only a safety net (and paces retries of failures)
+            signalled = self._dl_wakeup.wait(timeout=5.0)
+            self._dl_wakeup.clear()
+
+            if self._closing:
+                return
+            if not self._download_mode or not self.pollers.is_running():
+                self._dl_seen_version = -1  # rescan once we are switched back on
                 continue
 
-            cur = self.queue.current()
-            if not cur:
+            # a wake with no queue change since the last scan has nothing new to
+            # find; timeouts always rescan so failed downloads get retried
+            version = self.queue.version
+            if signalled and version == self._dl_seen_version:
                 continue
+            self._dl_seen_version = version
 
-            idx = self.queue.index_of_current()
-            targets = self.queue.tracks[idx : idx + 2]
+            # current + DOWNLOAD_LOOKAHEAD slots, snapshotted under the queue lock
+            # so a trim/clear on the GUI thread can't shift them mid-scan
+            window = self.queue.current_window(1 + DOWNLOAD_LOOKAHEAD)
+            inflight = self._dl_inflight
+            failed = self._dl_failed
+            now = time.monotonic()
 
-            for t in targets:
-                if t.local_path and Path(t.local_path).exists():
+            for t in window:
+                if t.track_id in inflight:
+                    continue
+                if failed.get(t.url, 0.0) > now:
+                    continue
+                if t.local_path and self._exists(t.local_path):
                     continue
                 if t.status in {"downloading", "playing", "paused"}:
                     continue
 
-                self.ui_events.put(
-                    {
-                        "type": "track_status",
-                        "track_id": t.track_id,
-                        "status": "downloading",
-                    }
-                )
-                try:
-                    out = self.downloader.download_mp3(t)
-                    self.ui_events.put(
-                        {
-                            "type": "download_done",
-                            "track_id": t.track_id,
-                            "path": str(out),
-                        }
-                    )
-                    self.ui_events.put(
-                        {"type": "log", "msg": f"✅ downloaded: {out.name}"}
-                    )
-                except Exception as e:
-                    self.ui_events.put(
-                        {
-                            "type": "track_status",
-                            "track_id": t.track_id,
-                            "status": "failed",
-                            "error": str(e),
-                        }
-                    )
+                # fire and forget: workers report back through ui_events. The
+                # status goes out first: a fast (or cached) download may post
+                # its DownloadDoneEvent before submit() even returns
+                inflight.add(t.track_id)
+                emit(TrackStatusEvent(t.track_id, "downloading"))
+                self._dl_jobs.put(t)
+
+    def _rescan_downloads(self) -> None:
+        # for triggers that change what needs downloading without touching
+        # queue.version (mode/polling switched on, temp wiped)
+        self._dl_seen_version = -1
+        self._dl_wakeup.set()
+
+    def _download_worker(self) -> None:
+        while True:
+            t = self._dl_jobs.get()
+            if t is None or self._closing:
+                return
+            self._download_one(t)
+
+    def _download_one(self, t: Track) -> None:
+        emit = self._emit
+        try:
+            out = self.downloader.download_mp3(t)
+            self._dl_failed.pop(t.url, None)
+            emit(DownloadDoneEvent(t.track_id, os.path.realpath(out)))
+            emit(LogEvent(f"✅ downloaded: {out.name}"))
+        except Exception as e:
+            self._dl_failed[t.url] = time.monotonic() + DOWNLOAD_RETRY_SEC
+            emit(TrackStatusEvent(t.track_id, "failed", str(e)))
+        finally:
+            self._dl_inflight.discard(t.track_id)
 
     # ======================================================================
     # PLAYBACK
@@ -371,35 +592,38 @@ class PlayerController:
         if not self._download_mode:
             webbrowser.open(t.url)
             t.status = "played"
-            self.queue.save()
+            self.queue.request_save()
             self.next_track(auto=True)
             return
 
         if not self.player.is_ready():
             self.on_log("❌ pygame not ready")
-            self.on_status_text("Audio error")
+            self._set_status("Audio error")
             return
 
-        if not t.local_path or not Path(t.local_path).exists():
+        if not t.local_path or not self._exists(t.local_path):
             if force:
-                self.on_status_text("Waiting download…")
+                self._set_status("Waiting download…")
             t.status = "queued"
-            self.queue.save()
+            self.queue.request_save()
+            self.on_ui_update()
             return
 
         try:
             self.player.play(t.local_path, volume=self._volume)
-            self._last_play_start_ts = time.time()
+            self._last_play_start_ts = time.monotonic()
             t.status = "playing"
-            self.queue.save()
-            self.on_status_text("Playing")
+            self.on_watchdog_active(True)
+            self.queue.request_save()
+            self._set_status("Playing")
             self._cleanup_temp_window()
             self.on_ui_update()
         except Exception as e:
             t.status = "failed"
             t.error = str(e)
-            self.queue.save()
+            self.queue.request_save()
             self.on_log(f"❌ play error: {e}")
+            self.on_ui_update()
 
     def play_pause(self) -> None:
         t = self.queue.current()
@@ -415,13 +639,17 @@ class PlayerController:
             t.status = "paused"
         elif self.player.is_paused():
             self.player.resume()
-            self._last_play_start_ts = time.time()
+            self._last_play_start_ts = time.monotonic()
             t.status = "playing"
+            self.on_watchdog_active(True)
         else:
+            # an explicit Play retries a link that failed to download
+            if self._dl_failed.pop(t.url, None) is not None:
+                self._rescan_downloads()
             self.play_current(force=True)
             return
 
-        self.queue.save()
+        self.queue.request_save()
         self.on_ui_update()
 
     # ======================================================================
@@ -440,7 +668,9 @@ class PlayerController:
 
         nid = self.queue.next_id()
         if not nid:
-            self.on_status_text("End of queue")
+            self.queue.request_save()
+            self._set_status("End of queue")
+            self.on_ui_update()
             return
 
         self._set_current(nid)
@@ -457,7 +687,7 @@ class PlayerController:
         cur = self.queue.current()
         if cur:
             cur.status = "skipped"
-            self.queue.save()
+            self.queue.request_save()
             self.player.stop()
             self.next_track(auto=False)
 
@@ -475,22 +705,27 @@ class PlayerController:
         if self._closing:
             return
 
+        # only a playing track can end; idle/paused -> stop ticking until
+        # play_current() / resume re-arm us
+        cur = self.queue.current()
+        if cur is None or cur.status != "playing":
+            self.on_watchdog_active(False)
+            return
+
         if not self.pollers.is_running() or not self._download_mode:
             return
 
         if self.player.is_paused():
             return
 
-        if (time.time() - self._last_play_start_ts) < 1.2:
+        if (time.monotonic() - self._last_play_start_ts) < 1.2:
             return
 
         if not self.player.is_playing():
-            cur = self.queue.current()
-            if cur and cur.status == "playing":
-                cur.status = "played"
-                self.queue.save()
-                self._cleanup_temp_window()
-                self.next_track(auto=True)
+            cur.status = "played"
+            self.queue.request_save()
+            self._cleanup_temp_window()
+            self.next_track(auto=True)
 
     # ======================================================================
     # CLEANUP
@@ -501,49 +736,61 @@ class PlayerController:
         if idx < 0:
             return
 
-        keep_ids = {
-            t.track_id
-            for t in self.queue.tracks[max(0, idx - 1) : idx + 2]
-            if t.local_path
-        }
-
+        # local_path is already canonical (see download_done), no resolve needed
         keep_paths = {
-            str(Path(t.local_path).resolve())
-            for t in self.queue.tracks
-            if t.track_id in keep_ids and t.local_path
+            t.local_path
+            for t in self.queue.tracks[max(0, idx - 1) : idx + 1 + DOWNLOAD_LOOKAHEAD]
+            if t.local_path
         }
 
-        Downloader.cleanup_keep(TEMP_DIR, keep_paths)
-
-        for t in self.queue.tracks:
-            if t.local_path and not Path(t.local_path).exists():
-                t.local_path = None
-
-        self.queue.save()
+        # same window and no new files since the last sweep: nothing to delete
+        if keep_paths == self._cleanup_keep_last:
+            return
+        if self._cleanup_keep_last is None:
+            deleted = Downloader.cleanup_keep(TEMP_DIR, keep_paths)
+        else:
+            # no file appeared since the last sweep, so temp holds exactly the
+            # previous keep set: delete what left the window, no directory walk
+            deleted = Downloader.remove_files(self._cleanup_keep_last - keep_paths)
+        self._cleanup_keep_last = keep_paths
+        for p in deleted:
+            self._path_exists_cache.pop(p, None)
+            for t in self._path_to_track.pop(p, ()):
+                if t.local_path == p:
+                    t.local_path = None
+
+        if deleted:
+            self.queue.request_save()
 
     def clear_temp(self) -> None:
         self.player.stop()
         shutil.rmtree(TEMP_DIR, ignore_errors=True)
         TEMP_DIR.mkdir(parents=True, exist_ok=True)
+        self._path_exists_cache.clear()
+        self._path_to_track.clear()
+        self._cleanup_keep_last = None
 
         for t in self.queue.tracks:
             t.local_path = None
             if t.status in {"downloading", "playing", "paused"}:
                 t.status = "queued"
 
-        self.queue.save()
+        self.queue.request_save()
+        self._rescan_downloads()
         self.on_log("🧹 temp cleared")
         self.on_ui_update()
 
     def clear_queue(self) -> None:
         self.player.stop()
         self.queue.clear()
+        self._path_exists_cache.clear()
+        self._path_to_track.clear()
         self.queue.set_current(None)
-        self.queue.save()
+        self.queue.request_save()
         self.config_data["current_track_id"] = None
-        save_json(self.config_file, self.config_data)
+        self._mark_config_dirty()
         self.on_log("🗑 queue cleared")
-        self.on_status_text("Queue cleared")
+        self._set_status("Queue cleared")
         self._update_now_playing()
         self.on_ui_update()
 
@@ -553,15 +800,37 @@ class PlayerController:
 
     def _update_now_playing(self) -> None:
         t = self.queue.current()
+        # the labels depend only on these fields (plus whether the file is
+        # still on disk); unchanged -> skip the rebuild
+        on_disk = bool(t and t.local_path and self._exists(t.local_path))
+        key = (t.track_id, t.title, t.status, t.local_path, on_disk) if t else None
+        if key == self._now_playing_key and self._last_now_playing is not None:
+            return
+        self._now_playing_key = key
+
         if not t:
-            self.on_now_playing("—", "Queue empty")
+            self._emit_now_playing("—", "Queue empty")
             return
 
         extra = f"Status: {t.status}"
-        if t.local_path and Path(t.local_path).exists():
-            extra += f" · {Path(t.local_path).name}"
+        if on_disk:
+            extra += f" · {os.path.basename(t.local_path)}"
+
+        self._emit_now_playing(f"[{t.source}] {t.title}", extra)
 
-        self.on_now_playing(f"[{t.source}] {t.title}", extra)
+    def _emit_now_playing(self, big: str, small: str) -> None:
+        # labels only change on real transitions; skip identical repaints
+        text = (big, small)
+        if text == self._last_now_playing:
+            return
+        self._last_now_playing = text
+        self.on_now_playing(big, small)
+
+    def _set_status(self, text: str) -> None:
+        if text == self._last_status_text:
+            return
+        self._last_status_text = text
+        self.on_status_text(text)
 
     # ======================================================================
     # CLOSE
@@ -571,9 +840,14 @@ class PlayerController:
         if self._closing:
             return
         self._closing = True
+        self._dl_wakeup.set()
+        # idle workers exit; one mid-transfer is a daemon and doesn't hold exit
+        for _ in range(1 + DOWNLOAD_LOOKAHEAD):
+            self._dl_jobs.put(None)
         self.pollers.stop()
         self._save_states()
-        self.queue.save()
+        self.queue.flush_now()
+        self._flush_dirty()
         try:
             self.player.shutdown()
         except Exception:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import weakref
 import webbrowser
-from PySide6.QtCore import Qt
+
+from PySide6.QtCore import QObject, Qt, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -14,51 +16,80 @@ from PySide6.QtWidgets import (
 
 
 class HelpDialog(QDialog):
+    """
+    Built once per parent and re-filled via set_content() on every show.
+    """
+
     def __init__(self, parent, title: str, text: str, link: str) -> None:
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setModal(True)
         self.setFixedSize(560, 320)
+        self._link = ""
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
         root.setSpacing(12)
 
-        lbl = QLabel(text)
-        lbl.setWordWrap(True)
-        root.addWidget(lbl)
+        self._text_lbl = QLabel()
+        self._text_lbl.setWordWrap(True)
+        root.addWidget(self._text_lbl)
 
         root.addWidget(QLabel("Ссылка:"))
-        link_lbl = QLabel(f'<a href="{link}">{link}</a>')
-        link_lbl.setTextFormat(Qt.RichText)
-        link_lbl.setTextInteractionFlags(Qt.TextBrowserInteraction)
-        link_lbl.setOpenExternalLinks(False)
-        link_lbl.linkActivated.connect(lambda _u: webbrowser.open(link))
-        root.addWidget(link_lbl)
+        self._link_lbl = QLabel()
+        self._link_lbl.setTextFormat(Qt.RichText)
+        self._link_lbl.setTextInteractionFlags(Qt.TextBrowserInteraction)
+        self._link_lbl.setOpenExternalLinks(False)
+        self._link_lbl.linkActivated.connect(lambda _u: webbrowser.open(self._link))
+        root.addWidget(self._link_lbl)
 
         row = QHBoxLayout()
         copy_btn = QPushButton("Copy")
         ok_btn = QPushButton("OK")
         ok_btn.setObjectName("Primary")
 
-        def copy_link() -> None:
-            QApplication.clipboard().setText(link)
-            QMessageBox.information(self, "OK", "Ссылка скопирована.")
-
-        copy_btn.clicked.connect(copy_link)
+        copy_btn.clicked.connect(self._copy_link)
         ok_btn.clicked.connect(self.accept)
 
+        # inline confirmation instead of a second modal box per copy
+        self._copied_lbl = QLabel("Ссылка скопирована.")
+        self._copied_lbl.hide()
+
         row.addWidget(copy_btn)
+        row.addWidget(self._copied_lbl)
         row.addStretch(1)
         row.addWidget(ok_btn)
         root.addLayout(row)
 
+        self.set_content(title, text, link)
+
+    def set_content(self, title: str, text: str, link: str) -> None:
+        self._link = link
+        self.setWindowTitle(title)
+        self._text_lbl.setText(text)
+        self._link_lbl.setText(f'<a href="{link}">{link}</a>')
+
+    def _copy_link(self) -> None:
+        QApplication.clipboard().setText(self._link)
+        self._copied_lbl.show()
+        QTimer.singleShot(800, self._copied_lbl.hide)
+
+
+# one confirmation box per parent, re-titled per call instead of rebuilt
+_yes_no_cache: "weakref.WeakKeyDictionary[QObject, QMessageBox]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def ask_yes_no(parent, title: str, text: str) -> bool:
-    box = QMessageBox(parent)
+    box = _yes_no_cache.get(parent) if parent is not None else None
+    if box is None:
+        box = QMessageBox(parent)
+        box.setIcon(QMessageBox.Question)
+        box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        if parent is not None:
+            _yes_no_cache[parent] = box
     box.setWindowTitle(title)
     box.setText(text)
-    box.setIcon(QMessageBox.Question)
-    box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+    # reset per call: the last answer must not become the next default
     box.setDefaultButton(QMessageBox.No)
     return box.exec() == QMessageBox.Yes
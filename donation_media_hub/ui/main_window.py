@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import os
+import shutil
 import sys
+import threading
 from pathlib import Path
+from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QEvent, QItemSelectionModel, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -30,7 +34,24 @@ from donation_media_hub.queue_manager import QueueManager
 from donation_media_hub.paths import TEMP_DIR
 
 
+def _has_mp3(d: Path) -> bool:
+    # scandir + suffix check: stops at the first mp3, no Path/fnmatch per entry
+    try:
+        with os.scandir(d) as it:
+            return any(e.name.endswith(".mp3") for e in it)
+    except OSError:
+        return False
+
+
+def _wipe_temp_dir() -> None:
+    shutil.rmtree(TEMP_DIR, ignore_errors=True)
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+
 class MainWindow(QMainWindow):
+    # emitted from worker threads; queued onto the GUI thread to drain events
+    events_pending = Signal()
+
     def __init__(
         self,
         queue_manager: QueueManager,
@@ -40,10 +61,14 @@ class MainWindow(QMainWindow):
     ) -> None:
         super().__init__()
         self.queue = queue_manager
+        self._help_dialog: Optional[HelpDialog] = None
+        # set below; widgets built earlier may fire signals before they exist
+        self.controller: Optional[PlayerController] = None
+        self.model: Optional[QueueTableModel] = None
+        self._refresh_pending = False
 
         self.setWindowTitle(APP_TITLE)
         self.resize(1180, 760)
-        self.setStyleSheet(load_qss())
 
         self._build_ui()
         self._wire()
@@ -54,12 +79,18 @@ class MainWindow(QMainWindow):
             config_file=config_file,
             state_da_file=state_da_file,
             state_dx_file=state_dx_file,
-            on_ui_update=self._ui_refresh,
+            on_ui_update=self._schedule_refresh,
             on_log=self._log,
             on_status_text=self._set_status,
             on_now_playing=self._set_now_playing,
             set_current_in_view=self._select_track_id,
+            on_events_pending=self.events_pending.emit,
+            on_watchdog_active=self._set_watchdog_active,
         )
+        self.events_pending.connect(
+            self.controller.process_ui_events, Qt.QueuedConnection
+        )
+        self._wire_transport()
 
         # ------------------------------------------------------------------
         # RESTORE CONFIG INTO UI (CRITICAL: BLOCK WIDGET SIGNALS)
@@ -107,19 +138,18 @@ class MainWindow(QMainWindow):
         # ------------------------------------------------------------------
         # TIMERS
         # ------------------------------------------------------------------
-        self.ev_timer = QTimer(self)
-        self.ev_timer.timeout.connect(self.controller.process_ui_events)
-        self.ev_timer.start(120)
-
-        self.wd_timer = QTimer(self)
-        self.wd_timer.timeout.connect(self.controller.watchdog)
-        self.wd_timer.start(450)
-
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self._ui_refresh)
-        self.refresh_timer.start(650)
-
-        # initial draw
+        # one tick for everything periodic: the playback watchdog every tick,
+        # a safety-net table refresh every 4th. Events and redraws are otherwise
+        # pushed by the controller, so the tick only runs while a track plays.
+        self._tick_n = 0
+        self.tick_timer = QTimer(self)
+        # ms-accurate cadence: the default coarse timer may slip by ~5%
+        self.tick_timer.setTimerType(Qt.PreciseTimer)
+        self.tick_timer.timeout.connect(self._tick)
+        self.tick_timer.start(450)
+
+        # initial draw (also drains anything queued before the signal was wired)
+        self.controller.process_ui_events()
         self._ui_refresh()
 
     # -------------------- UI --------------------
@@ -257,6 +287,12 @@ class MainWindow(QMainWindow):
         qcl.addWidget(QLabel("Queue (double click opens link)", objectName="Sub"))
 
         self.table = QTableView()
+        # fixed row height: the view never asks the model for per-row size hints
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(28)
+        self.table.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QTableView.ScrollPerPixel)
         qcl.addWidget(self.table, 1)
 
         main.addWidget(qc, 1)
@@ -270,6 +306,11 @@ class MainWindow(QMainWindow):
         self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
         self.log.setMaximumBlockCount(600)
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
         lcl.addWidget(self.log)
         main.addWidget(lc)
 
@@ -279,30 +320,68 @@ class MainWindow(QMainWindow):
         self.btn_help_da.clicked.connect(self._help_da)
         self.btn_help_dx.clicked.connect(self._help_dx)
 
-        self.show_tokens.toggled.connect(self._apply_show_tokens)
+        self.show_tokens.toggled.connect(self._toggle_show_tokens)
         self.download_mode.toggled.connect(self._save_config)
-        self.da_token.textChanged.connect(self._save_config)
-        self.dx_token.textChanged.connect(self._save_config)
+        self.da_token.textChanged.connect(self._on_token_edited)
+        self.dx_token.textChanged.connect(self._on_token_edited)
         self.vol.valueChanged.connect(self._on_volume)
 
+        # volume drags fire per step: apply live, persist once the slider settles
+        self._vol_save_timer = QTimer(self)
+        self._vol_save_timer.setSingleShot(True)
+        self._vol_save_timer.setInterval(300)
+        self._vol_save_timer.timeout.connect(self._save_config)
+
+        # same for typing a token: one save after the last keystroke, not per char
+        self._token_save_timer = QTimer(self)
+        self._token_save_timer.setSingleShot(True)
+        self._token_save_timer.setInterval(400)
+        self._token_save_timer.timeout.connect(self._save_config)
+
         self.btn_start.clicked.connect(self._start)
         self.btn_stop.clicked.connect(self._stop)
 
         self.btn_clear.clicked.connect(self._clear_queue)
         self.btn_temp.clicked.connect(self._clear_temp)
 
-        self.btn_go_start.clicked.connect(lambda: self.controller.go_start())
-        self.btn_prev.clicked.connect(lambda: self.controller.prev_track())
-        self.btn_play.clicked.connect(lambda: self.controller.play_pause())
-        self.btn_next.clicked.connect(lambda: self.controller.next_track(auto=False))
-        self.btn_skip.clicked.connect(lambda: self.controller.skip_track())
-
         self.table.doubleClicked.connect(self._open_selected_link)
         self.table.clicked.connect(self._select_current_from_table)
 
+    def _wire_transport(self) -> None:
+        # bound controller methods: needs the controller, so runs after _wire()
+        self.btn_go_start.clicked.connect(self.controller.go_start)
+        self.btn_prev.clicked.connect(self.controller.prev_track)
+        self.btn_play.clicked.connect(self.controller.play_pause)
+        self.btn_next.clicked.connect(self._next)
+        self.btn_skip.clicked.connect(self.controller.skip_track)
+
     # -------------------- UI helpers --------------------
     def _log(self, msg: str) -> None:
-        self.log.appendPlainText(msg)
+        # batched: at most one appendPlainText per 100ms, however many lines arrive
+        self._log_buf.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buf:
+            return
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        self.log.appendPlainText(text)
+
+    def _tick(self) -> None:
+        self._tick_n += 1
+        self.controller.watchdog()
+        if self._tick_n % 4 == 0:
+            self._ui_refresh()
+
+    def _set_watchdog_active(self, on: bool) -> None:
+        # the tick only runs while something is playing
+        if on:
+            if not self.tick_timer.isActive():
+                self.tick_timer.start()
+        else:
+            self.tick_timer.stop()
 
     def _set_status(self, text: str) -> None:
         self.status.setText(text)
@@ -311,34 +390,74 @@ class MainWindow(QMainWindow):
         self.now_title.setText(big)
         self.now_sub.setText(small)
 
+    def _schedule_refresh(self) -> None:
+        # coalesce a burst of controller updates into one refresh ~50ms later
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(50, self._ui_refresh)
+
     def _ui_refresh(self) -> None:
-        if hasattr(self, "model"):
+        self._refresh_pending = False
+        # nothing to paint while hidden/minimized; show/restore catches up
+        if not self.isVisible() or self.isMinimized():
+            return
+        if self.model is not None:
+            # no setUpdatesEnabled bracket: Qt already merges the row, selection
+            # and scroll updates into one paint on the next loop turn, and
+            # re-enabling would repaint the whole table instead of changed rows
             self.model.refresh()
             self._ensure_selection_visible()
 
     def _ensure_selection_visible(self) -> None:
         row = self.model.row_of_track_id(self.queue.current_track_id)
         if row >= 0:
-            idx = self.model.index(row, 0)
-            sel = self.table.selectionModel()
-            if sel and not sel.isRowSelected(row, idx.parent()):
-                self.table.selectRow(row)
-            self.table.scrollTo(idx)
+            self._select_row(row)
 
     def _select_track_id(self, track_id: str | None) -> None:
         row = self.model.row_of_track_id(track_id)
         if row >= 0:
-            self.table.selectRow(row)
+            self._select_row(row, scroll=False)
+
+    def _select_row(self, row: int, *, scroll: bool = True) -> None:
+        # one selection change (none if already current) and a scroll only when
+        # the row is off-screen; the cheap current-row compare goes first
+        idx = self.model.index(row, 0)
+        sel = self.table.selectionModel()
+        if sel is not None and (
+            sel.currentIndex().row() != row or not sel.isRowSelected(row)
+        ):
+            sel.setCurrentIndex(
+                idx, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+            )
+        if not scroll:
+            return
+        rect = self.table.visualRect(idx)
+        if not rect.isValid() or not self.table.viewport().rect().contains(rect):
+            self.table.scrollTo(idx)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        QTimer.singleShot(0, self._ui_refresh)
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            QTimer.singleShot(0, self._ui_refresh)
 
     # -------------------- actions --------------------
     def _apply_show_tokens(self) -> None:
         show = self.show_tokens.isChecked()
         self.da_token.setEchoMode(QLineEdit.Normal if show else QLineEdit.Password)
         self.dx_token.setEchoMode(QLineEdit.Normal if show else QLineEdit.Password)
+
+    def _toggle_show_tokens(self) -> None:
+        # user flip: re-mask and persist (startup restore only re-masks)
+        self._apply_show_tokens()
         self._save_config()
 
     def _save_config(self) -> None:
-        if not hasattr(self, "controller"):
+        if self.controller is None:
             return
         self.controller.save_config(
             da_token=self.da_token.text(),
@@ -348,10 +467,16 @@ class MainWindow(QMainWindow):
             volume=float(self.vol.value()) / 100.0,
         )
 
+    def _on_token_edited(self, _text: str) -> None:
+        self._token_save_timer.start()
+
     def _on_volume(self) -> None:
-        if hasattr(self, "controller"):
+        if self.controller is not None:
             self.controller.set_volume(float(self.vol.value()) / 100.0)
-            self._save_config()
+            self._vol_save_timer.start()
+
+    def _next(self) -> None:
+        self.controller.next_track(auto=False)
 
     def _start(self) -> None:
         self._save_config()
@@ -381,37 +506,38 @@ class MainWindow(QMainWindow):
             self.controller.open_current_link()
 
     # -------------------- help --------------------
+    def _show_help(self, title: str, text: str, link: str) -> None:
+        # one dialog for both buttons: re-filled, not rebuilt, on every click
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(self, title, text, link)
+        else:
+            self._help_dialog.set_content(title, text, link)
+        self._help_dialog.exec()
+
     def _help_da(self) -> None:
-        HelpDialog(
-            self,
+        self._show_help(
             "DonationAlerts — токен",
             "1) Открой страницу\n2) Найди «Секретный токен»\n3) Скопируй и вставь",
             "https://www.donationalerts.com/dashboard/general-settings/account",
-        ).exec()
+        )
 
     def _help_dx(self) -> None:
-        HelpDialog(
-            self,
+        self._show_help(
             "DonateX — токен",
             "1) Открой страницу\n2) «Последние донаты»\n3) В адресной строке token=XXXX\n4) Скопируй XXXX",
             "https://donatex.gg/streamer/dashboard",
-        ).exec()
+        )
 
     # -------------------- close --------------------
     def closeEvent(self, event) -> None:
+        wipe_temp = False
         try:
-            has_files = TEMP_DIR.exists() and any(TEMP_DIR.glob("*.mp3"))
-            if has_files:
-                yes = ask_yes_no(
+            if _has_mp3(TEMP_DIR):
+                wipe_temp = ask_yes_no(
                     self,
                     "Очистка временных файлов",
                     "Очистить загруженные треки (mp3) из temp папки?",
                 )
-                if yes:
-                    import shutil
-
-                    shutil.rmtree(TEMP_DIR, ignore_errors=True)
-                    TEMP_DIR.mkdir(parents=True, exist_ok=True)
         except Exception:
             pass
 
@@ -425,6 +551,11 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        if wipe_temp:
+            # after controller.close() so the player no longer holds a file;
+            # non-daemon, so the process still waits for it after the window is gone
+            threading.Thread(target=_wipe_temp_dir, name="temp-wipe").start()
+
         event.accept()
 
 
@@ -432,6 +563,8 @@ def run_qt(
     queue: QueueManager, config_file: Path, state_da_file: Path, state_dx_file: Path
 ) -> None:
     app = QApplication.instance() or QApplication(sys.argv)
+    # app-wide: parsed once and shared by the window and every dialog
+    app.setStyleSheet(load_qss())
     win = MainWindow(queue, config_file, state_da_file, state_dx_file)
     win.show()
     sys.exit(app.exec())
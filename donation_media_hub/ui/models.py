@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+from operator import attrgetter
+
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from donation_media_hub.models import Track
 from donation_media_hub.queue_manager import QueueManager
 
+# data() is the hottest model method: resolve the enums once, not per cell
+_DISPLAY = int(Qt.DisplayRole)
+_ALIGN = int(Qt.TextAlignmentRole)
+_ALIGN_C = int(Qt.AlignCenter)
+_ALIGN_L = int(Qt.AlignVCenter | Qt.AlignLeft)
+# one getter per column, in COLS order
+_COL_GETTERS = (attrgetter("source"), attrgetter("title"), attrgetter("status"))
+
 
 class QueueTableModel(QAbstractTableModel):
     COLS = ("Src", "Title", "Status")
@@ -11,9 +21,16 @@ class QueueTableModel(QAbstractTableModel):
     def __init__(self, queue: QueueManager) -> None:
         super().__init__()
         self.queue = queue
+        # the rows the view knows about; only refresh() moves them towards
+        # queue.tracks, inside the matching begin*/end* notifications
+        self._rows: list[Track] = []
+        # what the view last saw: (track_id, source, title, status) per row
+        self._snapshot: list[tuple[str, str, str, str]] = []
+        # track_id -> row in _rows; rebuilt only when rows are added/removed
+        self._id_to_row: dict[str, int] = {}
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return len(self.queue.tracks)
+        return len(self._rows)
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self.COLS)
@@ -28,40 +45,86 @@ class QueueTableModel(QAbstractTableModel):
         return str(section + 1)
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
-        if not index.isValid():
-            return None
-        r = index.row()
-        c = index.column()
-        if r < 0 or r >= len(self.queue.tracks):
-            return None
-        t = self.queue.tracks[r]
-
-        if role == Qt.DisplayRole:
-            if c == 0:
-                return t.source
-            if c == 1:
-                return t.title
-            if c == 2:
-                return t.status
-        if role == Qt.TextAlignmentRole:
-            if c in (0, 2):
-                return int(Qt.AlignCenter)
-            return int(Qt.AlignVCenter | Qt.AlignLeft)
+        if role == _DISPLAY:
+            return _COL_GETTERS[index.column()](self._rows[index.row()])
+        if role == _ALIGN:
+            return _ALIGN_L if index.column() == 1 else _ALIGN_C
         return None
 
     def refresh(self) -> None:
-        self.beginResetModel()
-        self.endResetModel()
+        """
+        Bring the view in line with the queue using the smallest notification:
+        nothing changed -> no-op; rows dropped from the head (trim) and/or
+        appended at the tail -> rowsRemoved/rowsInserted; changed rows ->
+        dataChanged. Anything else (clear, re-sort) is a full reset.
+        """
+        tracks = list(self.queue.snapshot())
+        new = [(t.track_id, t.source, t.title, t.status) for t in tracks]
+        if new == self._snapshot:
+            return
+
+        k = self._dropped_head(self._snapshot, new)
+        if k < 0:
+            self.beginResetModel()
+            self._rows = tracks
+            self._snapshot = new
+            self._reindex()
+            self.endResetModel()
+            return
+
+        if k:
+            self.beginRemoveRows(QModelIndex(), 0, k - 1)
+            del self._rows[:k]
+            del self._snapshot[:k]
+            self._reindex()
+            self.endRemoveRows()
+
+        kept = len(self._snapshot)
+        last_col = len(self.COLS) - 1
+        for r in range(kept):
+            if self._snapshot[r] != new[r]:
+                self._rows[r] = tracks[r]
+                self._snapshot[r] = new[r]
+                self.dataChanged.emit(
+                    self.index(r, 0), self.index(r, last_col), [Qt.DisplayRole]
+                )
+
+        if len(new) > kept:
+            self.beginInsertRows(QModelIndex(), kept, len(new) - 1)
+            self._rows.extend(tracks[kept:])
+            self._snapshot.extend(new[kept:])
+            self._reindex()
+            self.endInsertRows()
+
+    def _reindex(self) -> None:
+        self._id_to_row = {t.track_id: i for i, t in enumerate(self._rows)}
+
+    @staticmethod
+    def _dropped_head(old: list[tuple], new: list[tuple]) -> int:
+        """
+        How many leading rows of old were removed, if the rest of old is a
+        prefix of new (i.e. only head removal + tail append); -1 otherwise.
+        """
+        if not old:
+            return 0
+        if not new:
+            return len(old)
+        first = new[0][0]
+        k = next((i for i, row in enumerate(old) if row[0] == first), len(old))
+        n = len(old) - k
+        if n > len(new):
+            return -1
+        for a, b in zip(old[k:], new):
+            if a[0] != b[0]:
+                return -1
+        return k
 
     def track_at(self, row: int) -> Track | None:
-        if 0 <= row < len(self.queue.tracks):
-            return self.queue.tracks[row]
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
         return None
 
     def row_of_track_id(self, track_id: str | None) -> int:
         if not track_id:
             return -1
-        for i, t in enumerate(self.queue.tracks):
-            if t.track_id == track_id:
-                return i
-        return -1
+        return self._id_to_row.get(track_id, -1)
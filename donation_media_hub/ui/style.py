@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-
-def load_qss() -> str:
-    # keep it self-contained; if you later add assets/theme.qss, load it here.
-    return """
+# keep it self-contained; if you later add assets/theme.qss, load it here.
+_QSS = """
 *{font-family:"Segoe UI";font-size:10.5pt;}
 QMainWindow{background:#121212;}
 QWidget{color:#fff;}
@@ -30,3 +28,7 @@ QSlider::groove:horizontal{height:4px;background:#404040;border-radius:2px;}
 QSlider::handle:horizontal{background:#1db954;width:12px;margin:-4px 0;border-radius:6px;}
 QPlainTextEdit{background:#0f0f0f;border:1px solid #2a2a2a;border-radius:12px;padding:8px;color:#eaeaea;}
 """
+
+
+def load_qss() -> str:
+    return _QSS